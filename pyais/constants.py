@@ -52,9 +52,16 @@ class NavigationStatus(IntEnum):
 
     @classmethod
     def from_value(cls, v: typing.Optional[typing.Any]) -> typing.Optional["NavigationStatus"]:
+        if isinstance(v, int) and 0 <= v < len(_NAVIGATION_STATUS):
+            return _NAVIGATION_STATUS[v]
         return cls(v) if v is not None else None
 
 
+# Every possible (4 bit) status mapped to its member.
+# A tuple index is much cheaper than the enum lookup for every decoded message.
+_NAVIGATION_STATUS: typing.Tuple[NavigationStatus, ...] = tuple(NavigationStatus(i) for i in range(16))
+
+
 class ManeuverIndicator(IntEnum):
     NotAvailable = 0
     NoSpecialManeuver = 1
@@ -67,9 +74,15 @@ class ManeuverIndicator(IntEnum):
 
     @classmethod
     def from_value(cls, v: typing.Optional[typing.Any]) -> typing.Optional["ManeuverIndicator"]:
+        if isinstance(v, int) and 0 <= v < len(_MANEUVER_INDICATOR):
+            return _MANEUVER_INDICATOR[v]
         return cls(v) if v is not None else None
 
 
+# Lookup table used by ManeuverIndicator.from_value() (2 bits)
+_MANEUVER_INDICATOR: typing.Tuple[ManeuverIndicator, ...] = tuple(ManeuverIndicator(i) for i in range(4))
+
+
 class EpfdType(IntEnum):
     Undefined = 0
     GPS = 1
@@ -87,9 +100,15 @@ class EpfdType(IntEnum):
 
     @classmethod
     def from_value(cls, v: typing.Optional[typing.Any]) -> typing.Optional["EpfdType"]:
+        if isinstance(v, int) and 0 <= v < len(_EPFD_TYPE):
+            return _EPFD_TYPE[v]
         return cls(v) if v is not None else None
 
 
+# Lookup table used by EpfdType.from_value() (4 bits)
+_EPFD_TYPE: typing.Tuple[EpfdType, ...] = tuple(EpfdType(i) for i in range(16))
+
+
 class ShipType(IntEnum):
     NotAvailable = 0
     # 20's
@@ -187,9 +206,15 @@ class ShipType(IntEnum):
 
     @classmethod
     def from_value(cls, v: typing.Optional[typing.Any]) -> typing.Optional["ShipType"]:
+        if isinstance(v, int) and 0 <= v < len(_SHIP_TYPE):
+            return _SHIP_TYPE[v]
         return cls(v) if v is not None else None
 
 
+# Lookup table used by ShipType.from_value() (8 bits), including the reserved ranges
+_SHIP_TYPE: typing.Tuple[ShipType, ...] = tuple(ShipType(i) for i in range(256))
+
+
 class DacFid(IntEnum):
     DangerousCargoIndication = 13
     TidalWindow = 15
@@ -1,4 +1,3 @@
-import math
 import typing
 
 from pyais.messages import Payload, MSG_CLASS
@@ -52,7 +51,7 @@ def ais_to_nmea_0183(payload: str, ais_talker_id: str, radio_channel: str, fill_
     """
     messages = []
     max_len = 61
-    frag_cnt = math.ceil(len(payload) / max_len)
+    frag_cnt = (len(payload) + max_len - 1) // max_len
     seq_id = '0' if frag_cnt > 1 else ''
 
     if len(ais_talker_id) != 5:
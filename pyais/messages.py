@@ -1,4 +1,5 @@
 import abc
+import functools
 import json
 import math
 import typing
@@ -12,8 +13,8 @@ from pyais.constants import TalkerID, NavigationStatus, ManeuverIndicator, EpfdT
 from pyais.exceptions import InvalidNMEAMessageException, UnknownMessageException, UnknownPartNoException, \
     InvalidDataTypeException
 from pyais.util import decode_into_bit_array, compute_checksum, get_itdma_comm_state, get_sotdma_comm_state, int_to_bin, str_to_bin, \
-    encode_ascii_6, from_bytes, from_bytes_signed, decode_bin_as_ascii6, get_int, chk_to_int, coerce_val, \
-    bits2bytes, bytes2bits, b64encode_str
+    encode_ascii_6, from_bytes, decode_int_as_ascii6, get_int, chk_to_int, coerce_val, \
+    bits2bytes, bytes2bits, b64encode_str, validate_payload, SIX_BIT_VALUES
 
 NMEA_VALUE = typing.Union[str, float, int, bool, bytes]
 
@@ -29,8 +30,14 @@ def validate_message(msg: bytes) -> None:
     If not errors are found, nothing is returned.
     Otherwise an InvalidNMEAMessageException is raised.
     """
-    values = msg.split(b",")
+    validate_values(msg, msg.split(b","))
 
+
+def validate_values(msg: bytes, values: typing.List[bytes]) -> None:
+    """
+    Same as `validate_message`, but for a message that has already been split
+    into its comma separated values. This avoids splitting the message twice.
+    """
     # A message has exactly 7 comma separated values
     if len(values) != 7:
         raise InvalidNMEAMessageException(
@@ -163,11 +170,16 @@ class NMEAMessage(object):
         'bit_array'
     )
 
+    # The payload is decoded lazily on first access (see __getattr__)
+    bit_array: bitarray
+
     def __init__(self, raw: bytes) -> None:
         if not isinstance(raw, bytes):
             raise ValueError(f"'NMEAMessage' only accepts bytes, but got '{type(raw)}'")
 
-        validate_message(raw)
+        # An AIS NMEA message consists of seven, comma separated parts
+        values = raw.split(b",")
+        validate_values(raw, values)
 
         # Initial values
         self.checksum: int = -1
@@ -175,9 +187,6 @@ class NMEAMessage(object):
         # Store raw data
         self.raw: bytes = raw
 
-        # An AIS NMEA message consists of seven, comma separated parts
-        values = raw.split(b",")
-
         # Unpack NMEA message parts
         (
             head,
@@ -213,13 +222,26 @@ class NMEAMessage(object):
         # Message Checksum (hex value)
         self.checksum = check
 
-        # Finally decode bytes into bits
-        self.bit_array: bitarray = decode_into_bit_array(self.payload, self.fill_bits)
-        self.ais_id: int = get_int(self.bit_array, 0, 6)
+        # Only validate the payload here. It is decoded into bits when it is accessed for the
+        # first time. Fragments that are never assembled or messages that are filtered
+        # by their type or checksum therefore never pay for decoding.
+        validate_payload(payload)
+        # The message type is stored in the first six bits, which is the first character of the payload
+        self.ais_id: int = SIX_BIT_VALUES[payload[0]]
 
     def __str__(self) -> str:
         return str(self.raw)
 
+    if not typing.TYPE_CHECKING:
+        # Hidden from type checkers, because a __getattr__ would disable their attribute checks
+        def __getattr__(self, name: str) -> Any:
+            # Only called if the attribute was not found the usual ways,
+            # e.g. if the slot 'bit_array' was not set yet
+            if name == 'bit_array':
+                self.bit_array = decode_into_bit_array(self.payload, self.fill_bits)
+                return self.bit_array
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def __getitem__(self, item: str) -> Union[int, str, bytes, bitarray]:
         if isinstance(item, str):
             try:
@@ -321,9 +343,10 @@ class NMEAMessage(object):
         MessageType18(msg_type=18, ...)
         """
         try:
-            return MSG_CLASS[self.ais_id].from_bitarray(self.bit_array)
+            msg_cls = MSG_CLASS[self.ais_id]
         except KeyError as e:
             raise UnknownMessageException(f"The message {self} is not supported!") from e
+        return msg_cls.from_bitarray(self.bit_array)
 
 
 @attr.s(slots=True)
@@ -361,6 +384,32 @@ class Payload(abc.ABC):
         """
         return attr.fields(cls)  # type:ignore
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def decoding_fields(cls) -> typing.Tuple[typing.Tuple[typing.Any, str, int, int, int, typing.Any, typing.Any, bool], ...]:
+        """
+        The fields of this class together with everything that is needed to decode them.
+        The bit layout of a class never changes. So the offsets and bit masks of all fields
+        are computed only once per class.
+        Each entry is a tuple of (field, name, start, end, mask, d_type, to_converter, signed).
+        """
+        decoding_fields = []
+        start = 0
+        for field in cls.fields():
+            width = field.metadata['width']
+            decoding_fields.append((
+                field,
+                field.name,
+                start,
+                start + width,
+                (1 << width) - 1,
+                field.metadata['d_type'],
+                field.metadata['to_converter'],
+                field.metadata['signed'],
+            ))
+            start += width
+        return tuple(decoding_fields)
+
     def to_bitarray(self) -> bitarray:
         """
         Convert a payload to binary.
@@ -429,47 +478,51 @@ class Payload(abc.ABC):
 
     @classmethod
     def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
-        cur: int = 0
-        end: int = 0
         kwargs: typing.Dict[str, typing.Any] = {}
 
+        # Convert the whole bit array into a single integer once, so that every
+        # numeric field can be extracted with a single shift and mask
+        length: int = len(bit_arr)
+        payload: int = from_bytes(bit_arr) >> ((8 - (length % 8)) % 8)
+
+        # Bind frequently used globals to local names
+        force_type = cls.__force_type
+        ascii6 = decode_int_as_ascii6
+        to_bytes = bits2bytes
+
         # Iterate over the bits until the last bit of the bitarray or all fields are fully decoded
-        for field in cls.fields():
+        for field, name, start, end, mask, d_type, converter, signed in cls.decoding_fields():
 
-            if end >= len(bit_arr):
+            if start >= length:
                 # All fields that did not fit into the bit array are None
-                kwargs[field.name] = None
+                kwargs[name] = None
                 continue
 
-            width = field.metadata['width']
-            d_type = field.metadata['d_type']
-            converter = field.metadata['to_converter']
-
-            end = min(len(bit_arr), cur + width)
-            bits = bit_arr[cur: end]
+            if end > length:
+                # The last field may be cut off
+                end = length
+                mask = (1 << (end - start)) - 1
 
             val: typing.Any
             # Get the correct data type and decoding function
             if d_type in (int, bool, float):
-                shift = (8 - ((end - cur) % 8)) % 8
-                if field.metadata['signed']:
-                    val = from_bytes_signed(bits) >> shift
-                else:
-                    val = from_bytes(bits) >> shift
+                val = (payload >> (length - end)) & mask
+                if signed and val > (mask >> 1):
+                    # Two's complement: sign-extend negative values
+                    val -= mask + 1
                 val = d_type(val)
             elif d_type == str:
-                val = decode_bin_as_ascii6(bits)
+                val = ascii6((payload >> (length - end)) & mask, end - start)
             elif d_type == bytes:
-                val = bits2bytes(bits)
+                val = to_bytes(bit_arr[start: end])
             else:
                 raise InvalidDataTypeException(d_type)
 
-            val = converter(val) if converter is not None else val
-
-            val = cls.__force_type(field, val)
-            kwargs[field.name] = val
+            # Values are already of the field's type unless a converter changed them, e.g. into an IntEnum
+            if converter is not None:
+                val = force_type(field, converter(val))
 
-            cur = end
+            kwargs[name] = val
 
         return cls(**kwargs)  # type:ignore
 
@@ -557,6 +610,9 @@ class CommunicationStateMixin:
     https://www.itu.int/dms_pubrec/itu-r/rec/m/R-REC-M.1371-1-200108-S!!PDF-E.pdf
     """
 
+    # Without empty slots every message using this mixin would get a __dict__
+    __slots__ = ()
+
     radio: int  # Type hint to make mypy happy
 
     MAX_COMM_STATE_VALUE = 0x7ffff
@@ -1412,7 +1468,7 @@ class MessageType27(Payload):
 
     accuracy = bit_field(1, bool, default=0, signed=False)
     raim = bit_field(1, bool, default=0, signed=False)
-    status = bit_field(4, int, default=0, from_converter=NavigationStatus, to_converter=NavigationStatus, signed=False)
+    status = bit_field(4, int, default=0, converter=NavigationStatus.from_value, signed=False)
     lon = bit_field(18, float, from_converter=from_lat_lon_600, to_converter=to_lat_lon_600, default=0, signed=True)
     lat = bit_field(17, float, from_converter=from_lat_lon_600, to_converter=to_lat_lon_600, default=0, signed=True)
     speed = bit_field(6, float, default=0, signed=False)
@@ -225,8 +225,14 @@ class TCPConnection(SocketStream):
      https://en.wikipedia.org/wiki/NMEA_0183
      """
 
-    def recv(self) -> bytes:
-        return self._fobj.recv(self.BUF_SIZE)
+    def read(self) -> Generator[bytes, None, None]:
+        # TCP is a stream protocol: let the buffered reader of the socket reassemble
+        # lines that span multiple segments instead of splitting every chunk manually
+        with self._fobj.makefile('rb') as stream:
+            for line in stream:
+                line = line.rstrip(b'\r\n')
+                if line:
+                    yield line
 
     def __init__(self, host: str, port: int = 80) -> None:
         sock: socket = socket(AF_INET, SOCK_STREAM)
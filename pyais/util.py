@@ -6,6 +6,7 @@ from operator import xor
 from typing import Any, Generator, Hashable, TYPE_CHECKING, Union, Dict
 
 from bitarray import bitarray
+from bitarray.util import ba2base, base2ba, zeros
 
 from pyais.constants import SyncState
 
@@ -20,29 +21,57 @@ from_bytes_signed = partial(int.from_bytes, byteorder="big", signed=True)
 T = typing.TypeVar('T')
 
 
+# Six bit value of every possible byte of an armored AIS payload, indexed by the byte itself.
+# Bytes that are not allowed inside an AIS payload are mapped to -1.
+SIX_BIT_VALUES: typing.Tuple[int, ...] = tuple(
+    ((c - (0x30 if c < 0x60 else 0x38)) & 0x3F) if 0x30 <= c <= 0x77 else -1 for c in range(256)
+)
+
+# The standard base 64 alphabet: the n-th character encodes the six bit value n.
+BASE64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+# Translation table that maps the AIS payload armoring onto the standard base 64 alphabet.
+# Invalid bytes are mapped to '!', which is not a valid base 64 digit either.
+AIS_TO_BASE64 = bytes(BASE64_ALPHABET[v] if v >= 0 else 0x21 for v in SIX_BIT_VALUES)
+
+
+# All bytes that are allowed inside an armored AIS payload
+PAYLOAD_CHARS = bytes(c for c, v in enumerate(SIX_BIT_VALUES) if v >= 0)
+
+
+def validate_payload(data: bytes) -> None:
+    """
+    Raises a ValueError if the raw AIS payload contains invalid characters.
+    This is much cheaper than decoding the payload, because all valid characters
+    are removed by a single call to bytes.translate().
+    :param data:        Raw AIS message in bytes
+    """
+    invalid = data.translate(None, PAYLOAD_CHARS)
+    if invalid:
+        raise ValueError(f"Invalid character: {chr(invalid[0])}")
+
+
 def decode_into_bit_array(data: bytes, fill_bits: int = 0) -> bitarray:
     """
     Decodes a raw AIS message into a bitarray.
+    The AIS payload armoring is nothing else than base 64 with a different alphabet.
+    So the payload is translated into the standard base 64 alphabet and then decoded
+    by bitarray in a single call, instead of looping over every character in Python.
+
     :param data:        Raw AIS message in bytes
     :param fill_bits:   Number of trailing fill bits to be ignored
     :return:
     """
-    bit_arr = bitarray()
-    length = len(data)
-    for i, c in enumerate(data):
-        if c < 0x30 or c > 0x77 or 0x57 < c < 0x6:
-            raise ValueError(f"Invalid character: {chr(c)}")
-
-        # Convert 8 bit binary to 6 bit binary
-        c -= 0x30 if (c < 0x60) else 0x38
-        c &= 0x3F
+    try:
+        bit_arr = base2ba(64, data.translate(AIS_TO_BASE64), endian='big')
+    except ValueError:
+        # Raise an error that names the invalid character
+        validate_payload(data)
+        raise
 
-        if i == length - 1 and fill_bits:
-            # The last part be shorter than 6 bits and contain fill bits
-            c = c >> fill_bits
-            bit_arr += bitarray(f'{c:b}'.zfill(6 - fill_bits))
-        else:
-            bit_arr += bitarray(f'{c:06b}')
+    # The last part may be shorter than 6 bits and contain fill bits
+    if fill_bits:
+        del bit_arr[-fill_bits:]
 
     return bit_arr
 
@@ -58,14 +87,27 @@ def decode_bin_as_ascii6(bit_arr: bitarray) -> str:
     :param bit_arr: array of bits
     :return: ASCII String
     """
-    string: str = ""
-    c: bitarray
-    for c in chunks(bit_arr, 6):  # type:ignore
-        n: int = from_bytes(c.tobytes()) >> 2
+    length = len(bit_arr)
+    return decode_int_as_ascii6(from_bytes(bit_arr) >> ((8 - (length % 8)) % 8), length)
 
-        # Last entry may not have 6 bits
-        if len(c) != 6:
-            n >> (6 - len(c))
+
+def decode_int_as_ascii6(val: int, width: int) -> str:
+    """
+    Decode the lowest `width` bits of an integer as 6 bit ASCII.
+    Each character is extracted with a shift and a mask, so that no intermediate
+    sub-arrays need to be allocated.
+    :param val: integer that holds the bits
+    :param width: number of bits
+    :return: ASCII String
+    """
+    # Last entry may not have 6 bits: pad it with zeros on the right
+    padding = -width % 6
+    val <<= padding
+    width += padding
+
+    chars: typing.List[int] = []
+    for shift in range(width - 6, -1, -6):
+        n = (val >> shift) & 0x3F
 
         if n < 0x20:
             n += 0x40
@@ -74,9 +116,9 @@ def decode_bin_as_ascii6(bit_arr: bitarray) -> str:
         if n == 64:
             break
 
-        string += chr(n)
+        chars.append(n)
 
-    return string.strip()
+    return bytes(chars).decode('ascii').strip()
 
 
 def get_int(data: bitarray, ix_low: int, ix_high: int, signed: bool = False) -> int:
@@ -110,8 +152,9 @@ def compute_checksum(msg: Union[str, bytes]) -> int:
     if isinstance(msg, str):
         msg = msg.encode()
 
-    msg = msg[1:].split(b'*', 1)[0]
-    return reduce(xor, msg)
+    # Only the part between the leading `!` and the `*` is relevant
+    end = msg.find(b'*', 1)
+    return reduce(xor, msg[1:end] if end != -1 else msg[1:], 0)
 
 
 # https://gpsd.gitlab.io/gpsd/AIVDM.html#_aivdmaivdo_payload_armoring
@@ -137,6 +180,10 @@ SIX_BIT_ENCODING = {
 }
 
 
+# The six-bit bitstring of every value between 0 and 63, e.g. SIX_BIT_STRINGS[5] == '000101'
+SIX_BIT_STRINGS: typing.Tuple[str, ...] = tuple(f"{i:06b}" for i in range(64))
+
+
 def to_six_bit(char: str) -> str:
     """
     Encode a single character as six-bit bitstring.
@@ -145,12 +192,18 @@ def to_six_bit(char: str) -> str:
     """
     char = char.upper()
     try:
-        encoding = SIX_BIT_ENCODING[char]
-        return f"{encoding:06b}"
+        return SIX_BIT_STRINGS[SIX_BIT_ENCODING[char]]
     except KeyError:
         raise ValueError(f"received char '{char}' that cant be encoded")
 
 
+# Translation table that maps the standard base 64 alphabet onto the AIS payload armoring
+BASE64_TO_AIS = str.maketrans(
+    BASE64_ALPHABET.decode('ascii'),
+    ''.join(PAYLOAD_ARMOR[i] for i in range(64))
+)
+
+
 def encode_ascii_6(bits: bitarray) -> typing.Tuple[str, int]:
     """
     Transform the bitarray to an ASCII-encoded bit vector.
@@ -158,15 +211,13 @@ def encode_ascii_6(bits: bitarray) -> typing.Tuple[str, int]:
     @param bits: The bitarray to convert to an ASCII-encoded bit vector.
     @return: ASCII-encoded bit vector and the number of fill bits required to pad the data payload to a 6 bit boundary.
     """
-    out = ""
-    chunk: bitarray
-    padding = 0
-    for chunk in chunks(bits, 6):  # type:ignore
-        padding = 6 - len(chunk)
-        num = from_bytes(chunk.tobytes()) >> 2
-        armor = PAYLOAD_ARMOR[num]
-        out += armor
-    return out, padding
+    # The last chunk may have less than six bits: pad it with zeros
+    padding = -len(bits) % 6
+    if padding:
+        bits = bits + zeros(padding, endian='big')
+
+    # Encode as standard base 64 and translate into the payload armoring in one go
+    return ba2base(64, bits).translate(BASE64_TO_AIS), padding
 
 
 def int_to_bytes(val: typing.Union[int, bytes]) -> int:
@@ -187,7 +238,8 @@ def bits2bytes(bits: typing.Union[str, bitarray]) -> bytes:
     >>> bits2bytes('00100110')
     b'&'
     """
-    bits = bitarray(bits)
+    if isinstance(bits, str):
+        bits = bitarray(bits)
     return bits.tobytes()
 
 
@@ -254,23 +306,15 @@ def str_to_bin(val: str, width: int) -> bitarray:
     @param width:   The width of the full string. If the string has fewer characters than width, trailing '@' are added.
     @return:        The binary representation of value with exactly width bits. Type is bitarray.
     """
-    out = bitarray(endian='big')
-
     # Each char will be converted to a six-bit binary vector.
     # Therefore, the total number of chars is floor(WIDTH / 6).
-    num_chars = int(width / 6)
-
-    # Add trailing '@' if the string is shorter than `width`
-    for _ in range(num_chars - len(val)):
-        val += "@"
+    num_chars = width // 6
 
-    # Encode AT MOST width characters
-    for char in val[:num_chars]:
-        # Covert each char to six-bit ASCII vector
-        txt = to_six_bit(char)
-        out += bitarray(txt)
+    # Encode AT MOST width characters and add trailing '@' if the string is shorter than `width`
+    val = val[:num_chars].ljust(num_chars, "@")
 
-    return out
+    # Covert each char to six-bit ASCII and create the bitarray once at the end
+    return bitarray(''.join(map(to_six_bit, val)), endian='big')
 
 
 def chk_to_int(chk_str: bytes) -> typing.Tuple[int, int]:
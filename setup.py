@@ -37,7 +37,7 @@ setuptools.setup(
     keywords=["AIS", "ship", "decoding", "nmea"],
     python_requires='>=3.6',
     install_requires=[
-        "bitarray",
+        "bitarray>=2.0",
         "attrs"
     ],
     extras_require={
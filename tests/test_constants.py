@@ -1,6 +1,6 @@
 import unittest
 from pyais.constants import NavigationStatus, ManeuverIndicator, ShipType, NavAid, TransmitMode, StationIntervals, \
-    StationType
+    StationType, EpfdType
 
 
 class TestConstants(unittest.TestCase):
@@ -44,3 +44,9 @@ class TestConstants(unittest.TestCase):
         self.assertEqual(StationIntervals(11), StationIntervals.RESERVED)
         self.assertEqual(StationIntervals(7), StationIntervals.SECONDS_10)
         self.assertEqual(StationIntervals(12), StationIntervals.RESERVED)
+
+    def test_from_value_matches_enum_lookup(self):
+        for enum_cls in (NavigationStatus, ManeuverIndicator, EpfdType, ShipType):
+            for i in range(-2, 300):
+                self.assertIs(enum_cls.from_value(i), enum_cls(i))
+            self.assertIsNone(enum_cls.from_value(None))
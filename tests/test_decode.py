@@ -26,7 +26,7 @@ from pyais.messages import (MSG_CLASS, MessageType5, MessageType6,
                             MessageType26BroadcastUnstructured, from_turn,
                             to_turn)
 from pyais.stream import ByteStream
-from pyais.util import b64encode_str, bits2bytes, bytes2bits
+from pyais.util import b64encode_str, bits2bytes, bytes2bits, decode_into_bit_array, decode_int_as_ascii6
 
 
 def ensure_type_for_msg_dict(msg_dict: typing.Dict[str, typing.Any]) -> None:
@@ -246,6 +246,19 @@ class TestAIS(unittest.TestCase):
 
         ensure_type_for_msg_dict(msg)
 
+    def test_msg_type_6_with_six_fill_bits(self):
+        # All six bits of the last character are dropped. Older versions kept a stray zero bit.
+        nmea = NMEAMessage(b"!AIVDM,1,1,,2,601uEP19bi7P04810,6*5D")
+        assert nmea.fill_bits == 6
+        assert len(nmea.bit_array) == 96
+
+        msg = nmea.decode().asdict()
+        assert msg['mmsi'] == 2053504
+        assert msg['dest_mmsi'] == 308987000
+        assert msg['dac'] == 1
+        assert msg['fid'] == 2
+        assert msg['data'] == b'\x01'
+
     def test_msg_type_7(self):
         msg = decode(b"!AIVDM,1,1,,A,702R5`hwCjq8,0*6B").asdict()
         assert msg['mmsi'] == 2655651
@@ -694,6 +707,7 @@ class TestAIS(unittest.TestCase):
         assert msg['accuracy'] == 0
         assert msg['raim'] == 0
         assert msg['status'] == NavigationStatus.NotUnderCommand
+        assert isinstance(msg['status'], NavigationStatus)
         assert msg['lon'] == 137.023333
         assert msg['lat'] == 4.84
         assert msg['speed'] == 57
@@ -1113,6 +1127,32 @@ class TestAIS(unittest.TestCase):
         self.assertEqual(bytes2bits(b'\xff\xff\xff\xff\xff\xff\xff\xff').to01(), '1' * 64)
         self.assertEqual(bytes2bits(b'\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa').to01(), '10' * 32)
 
+    def test_messages_with_communication_state_are_slotted(self):
+        for raw in (
+            b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C",  # Type 1
+            b"!AIVDM,1,1,,A,403Ovl@000Htt<tSF0l4Q@100`Pq,0*28",  # Type 4
+            b"!AIVDO,1,1,,,B>qc:003wk?8mP=18D3Q3wgTiT;T,0*13",  # Type 18
+        ):
+            decoded = decode(raw)
+            self.assertFalse(hasattr(decoded, '__dict__'), type(decoded).__name__)
+
+    def test_decode_into_bit_array(self):
+        self.assertEqual(decode_into_bit_array(b'').to01(), '')
+        self.assertEqual(decode_into_bit_array(b'0').to01(), '000000')
+        self.assertEqual(decode_into_bit_array(b'w').to01(), '111111')
+        self.assertEqual(decode_into_bit_array(b'15').to01(), '000001000101')
+        self.assertEqual(decode_into_bit_array(b'15', 2).to01(), '0000010001')
+        self.assertEqual(decode_into_bit_array(b'w', 5).to01(), '1')
+
+        with self.assertRaises(ValueError):
+            decode_into_bit_array(b'1,5')
+
+    def test_decode_int_as_ascii6(self):
+        self.assertEqual(decode_int_as_ascii6(0b001000000101, 12), "HE")
+        self.assertEqual(decode_int_as_ascii6(0b001000000101000000001100, 24), "HE")
+        self.assertEqual(decode_int_as_ascii6(0b0010000001, 10), "HD")
+        self.assertEqual(decode_int_as_ascii6(0, 0), "")
+
     def test_b64encode_str(self):
         in_val = b'\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa'
         cipher = b64encode_str(in_val)
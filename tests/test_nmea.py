@@ -5,7 +5,7 @@ from bitarray import bitarray
 
 from pyais.exceptions import InvalidNMEAMessageException
 from pyais.messages import NMEAMessage
-from pyais.util import chk_to_int
+from pyais.util import chk_to_int, compute_checksum
 
 
 class TestNMEA(unittest.TestCase):
@@ -196,3 +196,37 @@ class TestNMEA(unittest.TestCase):
         self.assertEqual(chk_to_int(b""), (0, -1))
         with self.assertRaises(ValueError):
             self.assertEqual(chk_to_int(b"*1B"), (0, 24))
+
+    def test_compute_checksum(self):
+        self.assertEqual(compute_checksum(b"!AIVDM,1,1,,B,91b55wi;hbOS@OdQAC062Ch2089h,0*30"), 0x30)
+        self.assertEqual(compute_checksum("!AIVDM,1,1,,B,91b55wi;hbOS@OdQAC062Ch2089h,0*30"), 0x30)
+        self.assertEqual(compute_checksum(b"!AIVDM,1,1,,B,91b55wi;hbOS@OdQAC062Ch2089h,0"), 0x30)
+        self.assertEqual(compute_checksum(b"!*"), 0)
+        self.assertEqual(compute_checksum(b""), 0)
+
+    def test_bit_array_is_decoded_lazily(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,15Mj23P000G?q7fK>g:o7@1:0L3S,0*1B")
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(msg, 'bit_array')
+
+        self.assertEqual(msg.bit_array.to01()[:6], '000001')
+        self.assertIs(object.__getattribute__(msg, 'bit_array'), msg.bit_array)
+
+    def test_unknown_attribute_raises(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,15Mj23P000G?q7fK>g:o7@1:0L3S,0*1B")
+        with self.assertRaises(AttributeError):
+            getattr(msg, 'does_not_exist')
+        with self.assertRaises(KeyError):
+            msg['does_not_exist']
+
+        # Also after the bit array was decoded
+        self.assertEqual(msg.asdict()['bit_array'][:6], '000001')
+        with self.assertRaises(AttributeError):
+            getattr(msg, 'does_not_exist')
+
+        # Lazily decoded messages still compare equal
+        self.assertEqual(msg, NMEAMessage(b"!AIVDM,1,1,,A,15Mj23P000G?q7fK>g:o7@1:0L3S,0*1B"))
+
+    def test_invalid_payload_characters_raise_early(self):
+        with self.assertRaises(ValueError):
+            NMEAMessage(b"!AIVDM,1,1,,A,15Mj23P000G?q7fK>g:o7@1:0L3S~,0*1B")
@@ -67,3 +67,29 @@ class TestTCPStream(unittest.TestCase):
                         break
 
         self.server_thread.join()
+
+    def test_tcp_stream_reassembles_lines(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def send_fragmented():
+            conn, _ = server.accept()
+            with conn:
+                data = b"".join(msg + b"\r\n" for msg in MESSAGES[:6])
+                data += b"".join(msg + b"\n" for msg in MESSAGES[6:])
+                # Send in small chunks, so that lines span multiple segments
+                for i in range(0, len(data), 7):
+                    conn.sendall(data[i:i + 7])
+            server.close()
+
+        server_thread = threading.Thread(target=send_fragmented)
+        server_thread.start()
+
+        with time_limit(2):
+            with TCPConnection("127.0.0.1", port) as stream:
+                received = [msg.raw for msg in stream]
+
+        server_thread.join()
+        self.assertEqual(received, MESSAGES)